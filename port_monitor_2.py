@@ -23,13 +23,15 @@ from __future__ import annotations
 
 import sys
 import os
+import signal
+import ctypes
 import re
 import json
+import time
 import socket
-import webbrowser
 import subprocess
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict
+from dataclasses import dataclass, field, replace
+from typing import Callable, Iterable, List, Optional, Tuple, Dict, Union
 
 # --- opcjonalne zależności ---
 try:
@@ -44,12 +46,20 @@ try:
 except Exception:
     HAS_DOCKER_SDK = False
 
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
 # --- Qt ---
 from PySide6.QtCore import (
-    Qt, QAbstractTableModel, QModelIndex, QTimer, QSortFilterProxyModel,
-    Signal, QSettings, QSize
+    Qt, QCoreApplication, QAbstractTableModel, QModelIndex, QTimer, QSortFilterProxyModel,
+    Signal, Slot, QSettings, QSize, QObject, QThread, QRunnable, QThreadPool, QEvent, QUrl
 )
-from PySide6.QtGui import QAction, QGuiApplication, QIcon, QPixmap, QBrush
+from PySide6.QtGui import QAction, QDesktopServices, QGuiApplication, QIcon, QPixmap, QBrush
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLineEdit, QPushButton,
     QTableView, QHeaderView, QLabel, QSpinBox, QCheckBox, QMessageBox, QToolBar,
@@ -59,25 +69,61 @@ from PySide6.QtWidgets import (
 from PySide6.QtWidgets import QAbstractItemView
 
 # ------------------ Struktury danych ------------------
-@dataclass
+def _fmt_addr(addr: Union[str, Tuple[str, int]]) -> str:
+    if isinstance(addr, str):
+        return addr
+    return f"{addr[0]}:{addr[1]}" if addr else ""
+
+
+@dataclass(slots=True)
 class PortRecord:
     port: int
     protocol: str  # TCP/UDP
     status: str    # LISTEN, ESTABLISHED, FREE, ...
     pid: Optional[int]
     process: str
-    local_addr: str
-    remote_addr: str
+    # "ip:port" albo surowa para (ip, port) — tekst formatowany dopiero przy odczycie
+    laddr: Union[str, Tuple[str, int]]
+    raddr: Union[str, Tuple[str, int]]
     docker_name: str = ""
     docker_id: str = ""
     docker_image: str = ""
     docker_cport: Optional[int] = None
+    # Wartości liczone raz przy tworzeniu (także przy replace()), czytane przez model
+    _status_u: str = field(default="", init=False, repr=False, compare=False)
+    _docker_cell: str = field(default="", init=False, repr=False, compare=False)
+    _local_s: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _remote_s: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._status_u = self.status.upper()
+        if self.docker_name:
+            img = f" @ {self.docker_image}" if self.docker_image else ""
+            cport = f"{self.docker_cport}" if self.docker_cport else "?"
+            self._docker_cell = f"🐳 {self.docker_name} ({self.port}->{cport}/{self.protocol.lower()}){img}"
+
+    @property
+    def local_addr(self) -> str:
+        if self._local_s is None:
+            self._local_s = _fmt_addr(self.laddr)
+        return self._local_s
+
+    @property
+    def remote_addr(self) -> str:
+        if self._remote_s is None:
+            self._remote_s = _fmt_addr(self.raddr)
+        return self._remote_s
+
+    @property
+    def url(self) -> str:
+        # liczony dopiero przy „Otwórz” — nie dla każdego rekordu z każdego skanu
+        return "https://localhost" if self.port == 443 else f"http://localhost:{self.port}"
 
     @property
     def is_free(self) -> bool:
-        return self.status.upper() == "FREE"
+        return self._status_u == "FREE"
 
-@dataclass
+@dataclass(slots=True)
 class DockerPortInfo:
     container_id: str
     container_name: str
@@ -89,9 +135,98 @@ class DockerPortInfo:
 
 # ------------------ Enumeracja połączeń ------------------
 
-def _safe_proc_name(pid: Optional[int]) -> str:
+def _proc_names_snapshot() -> Dict[int, str]:
+    # Jeden przebieg process_iter na tick zamiast psutil.Process(pid) per połączenie
+    names: Dict[int, str] = {}
+    if not HAS_PSUTIL:
+        return names
+    try:
+        for p in psutil.process_iter(["pid", "name"]):
+            info = p.info
+            if info.get("name"):
+                names[info["pid"]] = info["name"]
+    except Exception:
+        pass
+    return names
+
+
+# Otwarte deskryptory /proc/<pid>/stat między tickami (tylko Linux, wątek workera)
+_PID_FD_CACHE: Dict[int, int] = {}
+# Limit trzymanych fd (RLIMIT_NOFILE bywa 1024) — ponad nim fd zamykamy po odczycie
+_PID_FD_CACHE_MAX = 256
+# PID -> (comm, pełna nazwa) dla nazw uciętych przez jądro; żyje razem z fd w _PID_FD_CACHE
+_PID_FULL_NAME: Dict[int, Tuple[bytes, str]] = {}
+_COMM_LEN = 15  # TASK_COMM_LEN - 1
+
+
+def _full_proc_name(pid: int, comm: str) -> str:
+    # Jak psutil: pełna nazwa z cmdline, o ile zaczyna się od ucięty comm
+    if HAS_PSUTIL:
+        try:
+            return psutil.Process(pid).name()
+        except Exception:
+            return comm
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            exe = f.read().split(b"\0", 1)[0].decode("utf-8", "replace")
+    except OSError:
+        return comm
+    base = os.path.basename(exe)
+    return base if base.startswith(comm) else comm
+
+
+def _drop_pid_fd(pid: int):
+    os.close(_PID_FD_CACHE.pop(pid))
+    _PID_FULL_NAME.pop(pid, None)
+
+
+def proc_names_linux(pids) -> Dict[int, str]:
+    # pread z trzymanego fd: martwy lub ponownie użyty PID daje błąd zamiast obcej nazwy
+    names: Dict[int, str] = {}
+    wanted = set(pids)
+    for pid in list(_PID_FD_CACHE):
+        if pid not in wanted:
+            _drop_pid_fd(pid)
+    for pid in wanted:
+        fd = _PID_FD_CACHE.get(pid)
+        cached = fd is not None
+        try:
+            if not cached:
+                fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+            buf = os.pread(fd, 512, 0)
+        except OSError:
+            if cached:
+                _drop_pid_fd(pid)
+            elif fd is not None:
+                os.close(fd)
+            continue
+        if not cached:
+            if len(_PID_FD_CACHE) < _PID_FD_CACHE_MAX:
+                _PID_FD_CACHE[pid] = fd
+            else:
+                os.close(fd)
+        start, end = buf.find(b"("), buf.rfind(b")")
+        if start == -1 or end <= start:
+            continue
+        comm = buf[start + 1:end]
+        name = comm.decode("utf-8", "replace")
+        if len(comm) == _COMM_LEN:
+            hit = _PID_FULL_NAME.get(pid)
+            if hit is not None and hit[0] == comm:  # po exec comm się zmienia
+                name = hit[1]
+            else:
+                name = _full_proc_name(pid, name)
+                if pid in _PID_FD_CACHE:
+                    _PID_FULL_NAME[pid] = (comm, name)
+        names[pid] = name
+    return names
+
+
+def _safe_proc_name(pid: Optional[int], names: Optional[Dict[int, str]] = None) -> str:
     if not pid:
         return ""
+    if names is not None:
+        return names.get(pid) or f"PID {pid}"
     if HAS_PSUTIL:
         try:
             return psutil.Process(pid).name()
@@ -100,6 +235,9 @@ def _safe_proc_name(pid: Optional[int]) -> str:
     return f"PID {pid}"
 
 
+_SOCK_STREAM = socket.SOCK_STREAM
+
+
 def list_used_ports_psutil() -> List[PortRecord]:
     records: List[PortRecord] = []
     try:
@@ -107,13 +245,15 @@ def list_used_ports_psutil() -> List[PortRecord]:
     except Exception:
         return records
 
+    if sys.platform.startswith("linux"):
+        names = proc_names_linux(c.pid for c in conns if c.pid and c.pid > 0)
+    else:
+        names = _proc_names_snapshot()
     for c in conns:
-        laddr = f"{c.laddr.ip}:{c.laddr.port}" if c.laddr else ""
-        raddr = f"{c.raddr.ip}:{c.raddr.port}" if c.raddr else ""
-        proto = "TCP" if c.type == socket.SOCK_STREAM else "UDP"
+        proto = "TCP" if c.type == _SOCK_STREAM else "UDP"
         status = c.status or ("LISTEN" if proto == "UDP" else "")
         pid = c.pid if c.pid and c.pid > 0 else None
-        name = _safe_proc_name(pid)
+        name = _safe_proc_name(pid, names)
         if c.laddr:
             records.append(PortRecord(
                 port=c.laddr.port,
@@ -121,21 +261,26 @@ def list_used_ports_psutil() -> List[PortRecord]:
                 status=status or "",
                 pid=pid,
                 process=name,
-                local_addr=laddr,
-                remote_addr=raddr,
+                laddr=c.laddr,
+                raddr=c.raddr,
             ))
     return records
 
 
+_PORT_RE = re.compile(r":(\d+)")
+_IS_TCPUDP_RE = re.compile(r"^(TCP|UDP)\b")
+
+
 def list_used_ports_netstat() -> List[PortRecord]:
     records: List[PortRecord] = []
     try:
         if os.name == 'nt':
             out = subprocess.check_output(["netstat", "-ano"], text=True, stderr=subprocess.STDOUT, encoding='utf-8', errors='ignore')
+            names = _proc_names_snapshot() if HAS_PSUTIL else None
             for line in out.splitlines():
                 line = line.strip()
-                if line.startswith("TCP") or line.startswith("UDP"):
-                    parts = re.split(r"\s+", line)
+                if _IS_TCPUDP_RE.match(line):
+                    parts = line.split()
                     if len(parts) < 4:
                         continue
                     proto = parts[0].upper()
@@ -152,22 +297,22 @@ def list_used_ports_netstat() -> List[PortRecord]:
                         port = int(local.rsplit(":", 1)[-1])
                     except Exception:
                         continue
-                    name = _safe_proc_name(pid)
+                    name = _safe_proc_name(pid, names)
                     records.append(PortRecord(
                         port=port,
                         protocol=proto,
                         status=state,
                         pid=pid,
                         process=name,
-                        local_addr=local,
-                        remote_addr=remote,
+                        laddr=local,
+                        raddr=remote,
                     ))
         else:
             out = subprocess.check_output(["lsof", "-nP", "-i"], text=True, stderr=subprocess.STDOUT)
             for line in out.splitlines()[1:]:
                 if not line.strip():
                     continue
-                parts = re.split(r"\s+", line, maxsplit=8)
+                parts = line.split(None, 8)
                 if len(parts) < 9:
                     continue
                 command, pid_s, user, fd, typ, device, sizeoff, node, name = parts
@@ -178,145 +323,347 @@ def list_used_ports_netstat() -> List[PortRecord]:
                     pass
                 proto = "TCP" if "TCP" in name else ("UDP" if "UDP" in name else "?")
                 status = "LISTEN" if "LISTEN" in name else ("ESTABLISHED" if "ESTABLISHED" in name else "")
-                m = re.search(r":(\d+)", name)
+                m = _PORT_RE.search(name)
                 if not m:
                     continue
                 port = int(m.group(1))
-                local_addr = name
-                remote_addr = ""
                 records.append(PortRecord(
                     port=port,
                     protocol=proto,
                     status=status,
                     pid=pid,
                     process=command,
-                    local_addr=local_addr,
-                    remote_addr=remote_addr,
+                    laddr=name,
+                    raddr="",
                 ))
     except Exception:
         pass
     return records
 
 
+# Kody stanów TCP z include/net/tcp_states.h (nazwy jak w psutil)
+_TCP_STATES = {
+    "01": "ESTABLISHED", "02": "SYN_SENT", "03": "SYN_RECV", "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2", "06": "TIME_WAIT", "07": "CLOSE", "08": "CLOSE_WAIT",
+    "09": "LAST_ACK", "0A": "LISTEN", "0B": "CLOSING",
+}
+
+
+def _decode_proc_addr(hex_addr: str) -> Tuple[str, int]:
+    # "0100007F:0CEA" -> ("127.0.0.1", 3306); adres to słowa 32-bit w porządku hosta (LE)
+    hex_ip, _, hex_port = hex_addr.partition(":")
+    raw = bytes.fromhex(hex_ip)
+    raw = b"".join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+    family = socket.AF_INET if len(raw) == 4 else socket.AF_INET6
+    return socket.inet_ntop(family, raw), int(hex_port, 16)
+
+
+def _socket_inode_owners() -> Dict[int, int]:
+    # inode gniazda -> PID, jeden przebieg po /proc/*/fd
+    owners: Dict[int, int] = {}
+    try:
+        procs = [e.name for e in os.scandir("/proc") if e.name.isdigit()]
+    except OSError:
+        return owners
+    for pid_s in procs:
+        try:
+            with os.scandir(f"/proc/{pid_s}/fd") as it:
+                for fd in it:
+                    try:
+                        target = os.readlink(fd.path)
+                    except OSError:
+                        continue
+                    if target.startswith("socket:["):
+                        owners[int(target[8:-1])] = int(pid_s)
+        except OSError:
+            continue  # brak uprawnień lub proces zniknął
+    return owners
+
+
+def list_used_ports_proc_net() -> List[PortRecord]:
+    # Linux bez psutil/lsof: bezpośredni odczyt /proc/net/{tcp,tcp6,udp,udp6}
+    rows: List[Tuple[str, str, str, str, int]] = []
+    for proto, fname in (("TCP", "tcp"), ("TCP", "tcp6"), ("UDP", "udp"), ("UDP", "udp6")):
+        try:
+            with open(f"/proc/net/{fname}") as fh:
+                lines = fh.read().splitlines()[1:]
+        except OSError:
+            continue
+        for line in lines:
+            parts = line.split()
+            if len(parts) < 10:
+                continue
+            try:
+                rows.append((proto, parts[1], parts[2], parts[3], int(parts[9])))
+            except ValueError:
+                continue
+
+    records: List[PortRecord] = []
+    if not rows:
+        return records
+    owners = _socket_inode_owners()
+    names = proc_names_linux({owners[r[4]] for r in rows if r[4] in owners})
+    for proto, local, remote, st, inode in rows:
+        try:
+            lip, lport = _decode_proc_addr(local)
+            rip, rport = _decode_proc_addr(remote)
+        except ValueError:
+            continue
+        pid = owners.get(inode)
+        status = _TCP_STATES.get(st, "") if proto == "TCP" else "LISTEN"
+        records.append(PortRecord(
+            port=lport,
+            protocol=proto,
+            status=status,
+            pid=pid,
+            process=_safe_proc_name(pid, names),
+            laddr=(lip, lport),
+            raddr=(rip, rport) if rport else "",
+        ))
+    return records
+
+
 def collect_used_ports() -> List[PortRecord]:
     if HAS_PSUTIL:
         recs = list_used_ports_psutil()
         if recs:
             return recs
+    if sys.platform.startswith("linux"):
+        recs = list_used_ports_proc_net()
+        if recs:
+            return recs
     return list_used_ports_netstat()
 
 # ------------------ Docker: porty ------------------
 
-def docker_available_via_cli() -> bool:
-    try:
-        subprocess.check_output(["docker", "version"], stderr=subprocess.STDOUT, text=True, timeout=3)
-        return True
-    except Exception:
-        return False
+# Do kiedy (time.monotonic) nie próbujemy CLI po nieudanym `docker ps`
+_DOCKER_CLI_DEAD_UNTIL = 0.0
 
 
-def collect_docker_ports() -> Dict[Tuple[str, int], List[DockerPortInfo]]:
+def docker_ports_sdk(client) -> Dict[Tuple[str, int], List[DockerPortInfo]]:
+    # GET /containers/json: porty wszystkich kontenerów jednym żądaniem; wyjątek = klient do wymiany
     index: Dict[Tuple[str, int], List[DockerPortInfo]] = {}
+    for c in client.api.containers(filters={"status": "running"}):
+        cid = (c.get("Id") or "")[:12]
+        name = (c.get("Names") or [""])[0].lstrip("/")
+        image = c.get("Image") or ""
+        for p in c.get("Ports") or []:
+            if "PublicPort" not in p:
+                continue  # port wystawiony tylko w sieci Dockera
+            try:
+                proto = p["Type"].upper()
+                host_port = int(p["PublicPort"])
+                cport = int(p["PrivatePort"])
+            except Exception:
+                continue
+            info = DockerPortInfo(
+                container_id=cid,
+                container_name=name,
+                image=image,
+                host_ip=p.get("IP", ""),
+                host_port=host_port,
+                container_port=cport,
+                protocol=proto,
+            )
+            index.setdefault((proto, host_port), []).append(info)
+    return index
 
-    if HAS_DOCKER_SDK:
-        try:
-            client = docker.from_env()
-            for c in client.containers.list():
-                attrs = c.attrs or {}
-                ns = attrs.get("NetworkSettings", {})
-                ports = ns.get("Ports", {}) or {}
-                image = ""
-                try:
-                    tags = c.image.tags or []
-                    image = tags[0] if tags else c.image.short_id
-                except Exception:
-                    image = ""
-                for key, binds in ports.items():
-                    try:
-                        cport_str, proto = key.split("/")
-                        proto = proto.upper()
-                        cport = int(cport_str)
-                    except Exception:
-                        continue
-                    if not binds:
-                        continue
-                    for bind in binds:
-                        try:
-                            host_port = int(bind.get("HostPort", ""))
-                        except Exception:
-                            continue
-                        host_ip = bind.get("HostIp", "")
-                        info = DockerPortInfo(
-                            container_id=c.id[:12],
-                            container_name=c.name,
-                            image=image,
-                            host_ip=host_ip,
-                            host_port=host_port,
-                            container_port=cport,
-                            protocol=proto,
-                        )
-                        index.setdefault((proto, host_port), []).append(info)
-            return index
-        except Exception:
-            pass
 
-    if docker_available_via_cli():
-        try:
-            out = subprocess.check_output(["docker", "ps", "--format", "{{json .}}"], text=True, stderr=subprocess.STDOUT)
-            for line in out.splitlines():
-                line = line.strip()
-                if not line:
+def docker_ports_cli() -> Dict[Tuple[str, int], List[DockerPortInfo]]:
+    global _DOCKER_CLI_DEAD_UNTIL
+    index: Dict[Tuple[str, int], List[DockerPortInfo]] = {}
+    if time.monotonic() < _DOCKER_CLI_DEAD_UNTIL:
+        return index
+    try:
+        out = subprocess.check_output(["docker", "ps", "--format", "{{json .}}"], text=True, stderr=subprocess.STDOUT, timeout=5)
+    except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        # brak CLI / demona — nie forkujemy ponownie przez 30 s
+        _DOCKER_CLI_DEAD_UNTIL = time.monotonic() + 30
+        return index
+    try:
+        for line in out.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = _json_loads(line)
+            except Exception:
+                continue
+            cid = (obj.get("ID") or "")[:12]
+            name = obj.get("Names") or ""
+            image = obj.get("Image") or ""
+            ports_str = obj.get("Ports") or ""
+            for entry in [e.strip() for e in ports_str.split(",") if e.strip()]:
+                left, arrow, right = entry.partition("->")
+                if not arrow:
                     continue
+                cport_s, slash, proto = right.partition("/")
+                if not slash:
+                    continue
+                hip, _, hport_s = left.rpartition(":")
                 try:
-                    obj = json.loads(line)
+                    proto = proto.upper()
+                    cport = int(cport_s)
+                    hport = int(hport_s)
                 except Exception:
                     continue
-                cid = (obj.get("ID") or "")[:12]
-                name = obj.get("Names") or ""
-                image = obj.get("Image") or ""
-                ports_str = obj.get("Ports") or ""
-                for entry in [e.strip() for e in ports_str.split(",") if e.strip()]:
-                    if "->" not in entry:
-                        continue
-                    left, right = entry.split("->", 1)
-                    try:
-                        proto = right.split("/", 1)[1].upper()
-                        cport = int(right.split("/", 1)[0])
-                    except Exception:
-                        continue
-                    try:
-                        hport = int(left.split(":")[-1])
-                    except Exception:
-                        continue
-                    hip = left.rsplit(":", 1)[0] if ":" in left else ""
-                    info = DockerPortInfo(
-                        container_id=cid,
-                        container_name=name,
-                        image=image,
-                        host_ip=hip,
-                        host_port=hport,
-                        container_port=cport,
-                        protocol=proto,
-                    )
-                    index.setdefault((proto, hport), []).append(info)
+                info = DockerPortInfo(
+                    container_id=cid,
+                    container_name=name,
+                    image=image,
+                    host_ip=hip,
+                    host_port=hport,
+                    container_port=cport,
+                    protocol=proto,
+                )
+                index.setdefault((proto, hport), []).append(info)
+    except Exception:
+        pass
+
+    return index
+
+
+# ------------------ Wątek skanujący ------------------
+class PortsWorker(QObject):
+    # Skany sieci i Dockera poza wątkiem GUI; wyniki wracają sygnałami
+    net_ready = Signal(list)
+    docker_ready = Signal(object)  # dict z kluczami-krotkami; Signal(dict) zgubiłby klucze (QVariantMap)
+
+    def __init__(self):
+        super().__init__()
+        # Jeden klient SDK na cały czas życia workera (keep-alive do demona)
+        self._docker_client = None
+
+    # Sloty emitują zawsze — bez wyniku flaga *_busy w oknie nie zeszłaby nigdy i skan by stanął
+    @Slot()
+    def scan_net(self):
+        records: List[PortRecord] = []
+        try:
+            records = collect_used_ports()
         except Exception:
             pass
+        self.net_ready.emit(records)
 
-    return index
+    @Slot()
+    def scan_docker(self):
+        index = None
+        if HAS_DOCKER_SDK:
+            try:
+                if self._docker_client is None:
+                    self._docker_client = docker.from_env(timeout=2)
+                index = docker_ports_sdk(self._docker_client)
+            except Exception:
+                self._docker_client = None  # połączymy się ponownie w następnym ticku
+        if index is None:
+            try:
+                index = docker_ports_cli()
+            except Exception:
+                index = {}
+        self.docker_ready.emit(index)
+
+class DockerEventsThread(QThread):
+    # Nasłuch docker events; live_changed(False) = zerwany strumień, okno wraca do odpytywania
+    container_changed = Signal()
+    live_changed = Signal(bool)
+
+    _ACTIONS = {"start", "stop", "die", "create", "destroy", "rename"}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._stream = None
+
+    def run(self):
+        while not self.isInterruptionRequested():
+            client = None
+            try:
+                # krótki timeout: przy martwym demonie próba nie wisi 60 s (sam strumień go nie ma)
+                client = docker.from_env(timeout=2)
+                self._stream = client.events(decode=True, filters={"type": "container"})
+                if self.isInterruptionRequested():
+                    break  # stop() mógł nie zdążyć zamknąć świeżego strumienia
+                self.live_changed.emit(True)
+                for ev in self._stream:
+                    if self.isInterruptionRequested():
+                        break
+                    if (ev.get("Action") or ev.get("status")) in self._ACTIONS:
+                        self.container_changed.emit()
+            except Exception:
+                pass
+            finally:
+                self._stream = None
+                if client is not None:
+                    try:
+                        client.close()  # bez tego każda ponowna próba zostawia otwartą sesję
+                    except Exception:
+                        pass
+            self.live_changed.emit(False)
+            for _ in range(100):
+                if self.isInterruptionRequested():
+                    return
+                self.msleep(100)
+
+    def _close_stream(self):
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()  # przerywa blokujący odczyt strumienia
+            except Exception:
+                pass
+
+    def stop(self):
+        self.requestInterruption()
+        self._close_stream()
+        # Okno nie może zniknąć z działającym QThread — czekamy, aż run() naprawdę się skończy
+        while not self.wait(500):
+            self._close_stream()  # strumień mógł zostać otwarty po poprzedniej próbie
+
+class _ActionRunnable(QRunnable):
+    # Blokująca akcja (kill, Docker) w puli; (ok, komunikat) wraca sygnałem action_done z id zadania
+
+    def __init__(self, fn: Callable[[], Tuple[bool, str]], done: Signal, job_id: int):
+        super().__init__()
+        self._fn = fn
+        self._done = done
+        self._job_id = job_id
+
+    def run(self):
+        try:
+            result = self._fn()
+        except Exception as e:
+            result = (False, str(e))
+        self._done.emit(self._job_id, result)
 
 # ------------------ Model tabeli ------------------
 class PortsTableModel(QAbstractTableModel):
     headers = ["Port", "Proto", "Status", "PID", "Proces", "Local", "Remote", "Docker"]
+    _DISPLAY = (
+        lambda r: r.port,
+        lambda r: r.protocol,
+        # Status jako czytelny chip (tekst), kolor nada ForegroundRole
+        lambda r: r.status,
+        lambda r: r.pid if r.pid is not None else "",
+        lambda r: r.process,
+        lambda r: r.local_addr,
+        lambda r: r.remote_addr,
+        lambda r: r._docker_cell,
+    )
+    # Kolorowanie statusów (nowoczesny look)
+    _BG = {s: QBrush(Qt.transparent) for s in ("FREE", "LISTEN", "ESTABLISHED")}
+    _FG = {
+        "FREE": QBrush(Qt.darkGreen),
+        "LISTEN": QBrush(Qt.darkCyan),
+        "ESTABLISHED": QBrush(Qt.darkBlue),
+    }
 
     def __init__(self, rows: List[PortRecord]):
         super().__init__()
         self._rows: List[PortRecord] = rows
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self._rows)
+        return 0 if parent.isValid() else len(self._rows)
 
     def columnCount(self, parent=QModelIndex()):
-        return len(self.headers)
+        return 0 if parent.isValid() else len(self.headers)
 
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
@@ -324,47 +671,14 @@ class PortsTableModel(QAbstractTableModel):
         rec = self._rows[index.row()]
         col = index.column()
 
-        if role in (Qt.DisplayRole, Qt.EditRole):
-            if col == 0:
-                return rec.port
-            elif col == 1:
-                return rec.protocol
-            elif col == 2:
-                # Status jako czytelny chip (tekst), kolor nada BackgroundRole
-                return rec.status or ("FREE" if rec.is_free else "")
-            elif col == 3:
-                return rec.pid if rec.pid is not None else ""
-            elif col == 4:
-                return rec.process
-            elif col == 5:
-                return rec.local_addr
-            elif col == 6:
-                return rec.remote_addr
-            elif col == 7:
-                if rec.docker_name:
-                    img = f" @ {rec.docker_image}" if rec.docker_image else ""
-                    cport = f"{rec.docker_cport}" if rec.docker_cport else "?"
-                    return f"🐳 {rec.docker_name} ({rec.port}->{cport}/{rec.protocol.lower()}){img}"
-                return ""
-
-        # Kolorowanie statusów (nowoczesny look)
-        if role == Qt.BackgroundRole and col == 2:
-            s = (rec.status or ("FREE" if rec.is_free else "")).upper()
-            if s == "FREE":
-                return QBrush(Qt.transparent)
-            if s == "LISTEN":
-                return QBrush(Qt.transparent)
-            if s == "ESTABLISHED":
-                return QBrush(Qt.transparent)
-        if role == Qt.ForegroundRole and col == 2:
-            s = (rec.status or ("FREE" if rec.is_free else "")).upper()
-            if s == "FREE":
-                return QBrush(Qt.darkGreen)
-            if s == "LISTEN":
-                return QBrush(Qt.darkCyan)
-            if s == "ESTABLISHED":
-                return QBrush(Qt.darkBlue)
-        if role == Qt.TextAlignmentRole and col in (0, 3):
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return self._DISPLAY[col](rec)
+        if col == 2:
+            if role == Qt.ForegroundRole:
+                return self._FG.get(rec._status_u)
+            if role == Qt.BackgroundRole:
+                return self._BG.get(rec._status_u)
+        elif role == Qt.TextAlignmentRole and (col == 0 or col == 3):
             return Qt.AlignRight | Qt.AlignVCenter
         return None
 
@@ -376,6 +690,64 @@ class PortsTableModel(QAbstractTableModel):
         return section + 1
 
     def setRows(self, rows: List[PortRecord]):
+        # Różnicowo po (proto, port), by nie gubić zaznaczenia; ponad połowa zmian lub inna kolejność -> reset
+        old_keys = [(r.protocol, r.port) for r in self._rows]
+        new_keys = [(r.protocol, r.port) for r in rows]
+        old_set, new_set = set(old_keys), set(new_keys)
+        removed = old_set - new_set
+        added = new_set - old_set
+        if (len(old_set) != len(old_keys) or len(new_set) != len(new_keys)
+                or len(added) + len(removed) > len(rows) // 2):
+            self._reset_rows(rows)
+            return
+
+        root = QModelIndex()
+        self._rows = list(self._rows)
+        i = len(old_keys) - 1
+        while i >= 0:
+            if old_keys[i] not in removed:
+                i -= 1
+                continue
+            j = i
+            while j > 0 and old_keys[j - 1] in removed:
+                j -= 1
+            self.beginRemoveRows(root, j, i)
+            del self._rows[j:i + 1]
+            self.endRemoveRows()
+            i = j - 1
+
+        i, n = 0, len(new_keys)
+        while i < n:
+            if new_keys[i] not in added:
+                i += 1
+                continue
+            j = i
+            while j + 1 < n and new_keys[j + 1] in added:
+                j += 1
+            self.beginInsertRows(root, i, j)
+            self._rows[i:i] = rows[i:j + 1]
+            self.endInsertRows()
+            i = j + 1
+
+        if [(r.protocol, r.port) for r in self._rows] != new_keys:
+            self._reset_rows(rows)
+            return
+
+        prev, self._rows = self._rows, rows
+        last_col = len(self.headers) - 1
+        i = 0
+        while i < n:
+            a, b = prev[i], rows[i]
+            if a is b or a == b:
+                i += 1
+                continue
+            j = i
+            while j + 1 < n and prev[j + 1] is not rows[j + 1] and prev[j + 1] != rows[j + 1]:
+                j += 1
+            self.dataChanged.emit(self.index(i, 0), self.index(j, last_col))
+            i = j + 1
+
+    def _reset_rows(self, rows: List[PortRecord]):
         self.beginResetModel()
         self._rows = rows
         self.endResetModel()
@@ -383,6 +755,31 @@ class PortsTableModel(QAbstractTableModel):
     def row(self, r: int) -> PortRecord:
         return self._rows[r]
 
+class PortsFilterProxy(QSortFilterProxyModel):
+    # Szybki filtr tekstowy: najpierw numer portu, potem pozostałe kolumny
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+
+    def setNeedle(self, text: str):
+        needle = text.strip().lower()
+        if needle != self._needle:
+            self._needle = needle
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        needle = self._needle
+        if not needle:
+            return True
+        rec = self.sourceModel().row(source_row)
+        if str(rec.port).startswith(needle):
+            return True
+        for get in PortsTableModel._DISPLAY:
+            if needle in str(get(rec)).lower():
+                return True
+        return False
+
 # ------------------ Style (QSS) ------------------
 LIGHT_QSS = """
 * { font-size: 13px; }
@@ -424,9 +821,21 @@ QLabel#BadgeWarn { background: #3a2418; color: #ffb38a; border-radius: 10px; pad
 QLabel#BadgeOk { background: #15382a; color: #67d29a; border-radius: 10px; padding: 2px 8px; }
 """
 
+def _range_order(key: Tuple[str, int]) -> Tuple[bool, int]:
+    # kolejność jak w pełnym zakresie: najpierw TCP rosnąco, potem UDP
+    return key[0] != "TCP", key[1]
+
+def _set_text(w, value) -> None:
+    # setText tylko przy zmianie — bez tego każda strzałka w tabeli relayoutuje panel
+    text = str(value)
+    if w.text() != text:
+        w.setText(text)
+
 # ------------------ Główne okno ------------------
 class MainWindow(QMainWindow):
     request_refresh = Signal()
+    request_docker = Signal()
+    action_done = Signal(int, object)
 
     def __init__(self):
         super().__init__()
@@ -468,6 +877,12 @@ class MainWindow(QMainWindow):
         self.le_filter.setFixedWidth(360)
         tb.addSeparator(); tb.addWidget(self.le_filter)
 
+        # Co ile skanować sieć (ms), zapamiętane w ustawieniach
+        self.spin_interval = QSpinBox(); self.spin_interval.setRange(1000, 60000); self.spin_interval.setSingleStep(1000)
+        self.spin_interval.setSuffix(" ms")
+        self.spin_interval.setValue(int(self.settings.value("refresh_ms", 5000)))
+        tb.addSeparator(); tb.addWidget(QLabel("Odświeżanie:")); tb.addWidget(self.spin_interval)
+
         # Przyciski
         btn_scan = QPushButton("Skanuj zakres"); btn_scan.setIcon(ico_search)
         btn_refresh = QPushButton("Odśwież"); btn_refresh.setIcon(ico_refresh)
@@ -487,19 +902,25 @@ class MainWindow(QMainWindow):
         self.table.customContextMenuRequested.connect(self._on_table_ctx)
 
         self.model = PortsTableModel([])
-        self.proxy = QSortFilterProxyModel(self)
+        self.proxy = PortsFilterProxy(self)
         self.proxy.setSourceModel(self.model)
-        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.proxy.setFilterKeyColumn(-1)
         self.table.setModel(self.proxy)
 
+        # Stałe szerokości zamiast Stretch/ResizeToContents — Qt nie mierzy wszystkich wierszy przy każdej zmianie
         hh = self.table.horizontalHeader()
         hh.setSectionResizeMode(QHeaderView.Interactive)
-        for i in range(self.model.columnCount()):
-            hh.setSectionResizeMode(i, QHeaderView.Stretch)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        for col, width in ((0, 80), (1, 60), (2, 110), (3, 80), (4, 160), (5, 170), (6, 170)):
+            hh.resizeSection(col, width)
+        hh.setSectionResizeMode(7, QHeaderView.Stretch)
+        vh = self.table.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(24)
+        vh.setVisible(False)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        # Różnicowe setRows zachowuje zaznaczenie, więc zmiana treści wybranego wiersza nie daje selectionChanged
+        self.model.dataChanged.connect(self._on_model_data_changed)
+        self.model.modelReset.connect(self._refresh_detail_buttons)
 
         # Panel szczegółów (karta)
         self.detail_card = QFrame(); self.detail_card.setObjectName("Card")
@@ -536,6 +957,7 @@ class MainWindow(QMainWindow):
         # Przyciski akcji w karcie
         btn_row = QHBoxLayout()
         self.btn_open = QPushButton("Otwórz http://localhost:PORT")
+        self._btn_open_port: Optional[int] = None  # port, dla którego sformatowano tekst przycisku
         self.btn_kill = QPushButton("Zakończ proces")
         self.btn_stop = QPushButton("Zatrzymaj kontener")
         self.btn_restart = QPushButton("Restart kontenera")
@@ -551,6 +973,7 @@ class MainWindow(QMainWindow):
 
         # StatusBar
         self.setStatusBar(QStatusBar())
+        self._build_ctx_menu()
 
         # Centralny layout
         central = QWidget(); root = QVBoxLayout(central); root.addWidget(splitter); self.setCentralWidget(central)
@@ -561,7 +984,11 @@ class MainWindow(QMainWindow):
         btn_docker.clicked.connect(self.refresh_docker)
         self.cb_only_used.toggled.connect(self.update_view)
         self.cb_only_docker.toggled.connect(self.update_view)
-        self.le_filter.textChanged.connect(self.proxy.setFilterFixedString)
+        self.spin_interval.valueChanged.connect(self._on_interval_changed)
+        # Filtr uruchamiany dopiero po przerwie w pisaniu, nie po każdym klawiszu
+        self._filter_timer = QTimer(self); self._filter_timer.setSingleShot(True); self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self.proxy.setNeedle(self.le_filter.text()))
+        self.le_filter.textChanged.connect(self._filter_timer.start)
         self.btn_theme.clicked.connect(self.toggle_theme)
 
         self.btn_open.clicked.connect(self._detail_open)
@@ -569,53 +996,181 @@ class MainWindow(QMainWindow):
         self.btn_stop.clicked.connect(self._detail_stop)
         self.btn_restart.clicked.connect(self._detail_restart)
 
-        # Timery odświeżające
-        self.timer = QTimer(self); self.timer.timeout.connect(self.refresh_now); self.timer.start(5000)
-        self.timer_docker = QTimer(self); self.timer_docker.timeout.connect(self.refresh_docker); self.timer_docker.start(10000)
-
         # Dane
         self._all_records: List[PortRecord] = []
         self._docker_index: Dict[Tuple[str, int], List[DockerPortInfo]] = {}
+        # Rekordy FREE tworzone raz i współdzielone między odświeżeniami (nie mutujemy ich)
+        self._free_rows: Dict[Tuple[str, int], PortRecord] = {}
+        # Kontenery widoczne w bieżącym widoku: docker_id -> pierwszy wiersz z jego mapowaniem
+        self._by_docker_id: Dict[str, PortRecord] = {}
+
+        # Worker w osobnym wątku — GUI aktualizujemy tylko w slotach _on_*_ready
+        self.worker = PortsWorker()
+        self._worker_thread = QThread(self)
+        self.worker.moveToThread(self._worker_thread)
+        self.request_refresh.connect(self.worker.scan_net)
+        self.request_docker.connect(self.worker.scan_docker)
+        self.worker.net_ready.connect(self._on_net_ready)
+        self.worker.docker_ready.connect(self._on_docker_ready)
+        self._net_busy = False
+        self._docker_busy = False
+        self._worker_thread.start()
+
+        # Akcje w puli wątków: id zadania -> (runnable, callback w wątku GUI)
+        self._actions: Dict[int, Tuple[_ActionRunnable, Callable[[bool, str], None]]] = {}
+        self._action_seq = 0
+        self._docker_client = None
+        self.action_done.connect(self._on_action_done, Qt.QueuedConnection)
+        # Czy SDK sięga demona; do czasu wyniku sondy zakładamy, że tak
+        self._sdk_ok = HAS_DOCKER_SDK
+        if HAS_DOCKER_SDK:
+            self._run_action(self._probe_sdk, self._on_sdk_probed)
+
+        # Jeden zegar-planista: co sekundę sprawdza terminy skanów sieci i Dockera
+        self._net_interval = self.spin_interval.value() / 1000.0
+        self._docker_interval = 10.0
+        self._next_net_due = 0.0
+        self._next_docker_due = 0.0
+        # Skróty danych wejściowych widoku — identyczny zestaw nie przebudowuje tabeli
+        self._net_sig: Optional[int] = None
+        self._docker_sig: Optional[int] = None
+        self._last_sig = None
+        self._status_hold_until = 0.0
+        self.timer = QTimer(self); self.timer.setInterval(1000); self.timer.timeout.connect(self._tick); self.timer.start()
+        QGuiApplication.instance().applicationStateChanged.connect(lambda _state: self._update_timer_state())
+
+        # Zdarzenia Dockera: kilka zdarzeń w ciągu 300 ms daje jeden skan mapowań
+        self._docker_event_timer = QTimer(self); self._docker_event_timer.setSingleShot(True); self._docker_event_timer.setInterval(300)
+        self._docker_event_timer.timeout.connect(self.refresh_docker)
+        self._docker_events_live = False
+        self._docker_rescan = False
+        self._docker_events: Optional[DockerEventsThread] = None
+        if HAS_DOCKER_SDK:
+            self._docker_events = DockerEventsThread(self)
+            self._docker_events.container_changed.connect(self._docker_event_timer.start)
+            self._docker_events.live_changed.connect(self._on_docker_events_live)
+            self._docker_events.start()
+
+        # Pełne odświeżenie (sieć + Docker) po akcjach — seria akcji w ciągu 50 ms daje jeden przebieg
+        self._refresh_timer = QTimer(self); self._refresh_timer.setSingleShot(True); self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_full_refresh)
 
         # Motyw
+        self._applied_dark: Optional[bool] = None
         self.active_dark = self.settings.value("theme_dark", True, bool)
         self.apply_theme(self.active_dark)
 
         # Start
-        self.refresh_docker(); self.refresh_now()
+        self.update_view()
+        self._refresh_timer.start()
         if self.proxy.rowCount() > 0:
             self.table.selectRow(0)
 
     # ---------- Dane ----------
+    def _tick(self):
+        t = time.monotonic()
+        if t >= self._next_net_due:
+            self.refresh_now()
+        # Przy żywym strumieniu zdarzeń Dockera nie odpytujemy
+        if not self._docker_events_live and t >= self._next_docker_due:
+            self.refresh_docker()
+
     def refresh_now(self):
-        used = collect_used_ports()
-        self._all_records = used
-        self.statusBar().showMessage(f"Znaleziono {len(used)} aktywnych wpisów (sieć)")
-        self.update_view()
+        # Wolny skan nie może się nawarstwiać — kolejny dopiero po wyniku poprzedniego
+        if self._net_busy:
+            return
+        self._net_busy = True
+        self._next_net_due = time.monotonic() + self._net_interval
+        self.request_refresh.emit()
+
+    def _on_interval_changed(self, ms: int):
+        self._net_interval = ms / 1000.0
+        self._next_net_due = time.monotonic() + self._net_interval
+        self.settings.setValue("refresh_ms", ms)
+
+    def _do_full_refresh(self):
+        self.refresh_docker(); self.refresh_now()
 
     def refresh_docker(self):
-        self._docker_index = collect_docker_ports()
+        if self._docker_busy:
+            # zmiana mogła nastąpić po starcie trwającego skanu — powtórzymy go
+            self._docker_rescan = True
+            return
+        self._docker_busy = True
+        self._next_docker_due = time.monotonic() + self._docker_interval
+        self.request_docker.emit()
+
+    def _on_docker_events_live(self, live: bool):
+        self._docker_events_live = live
+        if live:
+            self._sdk_ok = True  # strumień działa, więc SDK znów sięga demona
+        else:
+            self._next_docker_due = 0.0  # bez strumienia wracamy do odpytywania od razu
+
+    def _scan_status(self, msg: str):
+        # Komunikaty skanów nie zasłaniają świeżego wyniku akcji
+        if time.monotonic() >= self._status_hold_until:
+            self.statusBar().showMessage(msg)
+
+    def _notify(self, msg: str, ms: int = 3000):
+        self.statusBar().showMessage(msg, ms)
+        self._status_hold_until = time.monotonic() + ms / 1000.0
+
+    def _scan_finished(self):
+        # Wyniki obu skanów z jednego cyklu dają jedno update_view() — po ostatnim z nich
+        if not (self._net_busy or self._docker_busy):
+            self.update_view()
+
+    def _on_net_ready(self, used: List[PortRecord]):
+        self._net_busy = False
+        self._all_records = used
+        self._net_sig = hash(tuple(
+            (r.protocol, r.port, r.status, r.pid, r.process, r.laddr, r.raddr) for r in used
+        ))
+        self._scan_status(f"Znaleziono {len(used)} aktywnych wpisów (sieć)")
+        self._scan_finished()
+
+    def _on_docker_ready(self, index: Dict[Tuple[str, int], List[DockerPortInfo]]):
+        self._docker_busy = False
+        if self._docker_rescan:
+            self._docker_rescan = False
+            self.refresh_docker()
+        self._docker_index = index
+        self._docker_sig = hash(tuple(
+            (key, tuple((i.container_id, i.container_name, i.image, i.container_port) for i in infos))
+            for key, infos in index.items()
+        ))
         if self._docker_index:
             msg = f"Docker: wykryto {sum(len(v) for v in self._docker_index.values())} mapowań"
         else:
             msg = "Docker: brak mapowań lub niedostępny"
-        self.statusBar().showMessage(msg)
-        self.update_view()
-
-    def _enrich_with_docker(self, rows: List[PortRecord]) -> List[PortRecord]:
-        for r in rows:
-            infos = self._docker_index.get((r.protocol.upper(), int(r.port)))
-            if not infos and r.protocol.upper() == "UDP":
-                infos = self._docker_index.get(("TCP", int(r.port)))
-            if infos:
-                primary = infos[0]
-                r.docker_name = primary.container_name
-                r.docker_id = primary.container_id
-                r.docker_image = primary.image
-                r.docker_cport = primary.container_port
-                if len(infos) > 1:
-                    r.docker_name += f" (+{len(infos)-1})"
-        return rows
+        self._scan_status(msg)
+        self._scan_finished()
+
+    def _stamp_docker(self, rows: List[PortRecord], row_pos: Dict[Tuple[str, int], int]):
+        # Mapowania Dockera na wiersze; pętla po indeksie Dockera, nie po wierszach
+        index = self._docker_index
+        by_id: Dict[str, PortRecord] = {}
+        for (proto, hport), infos in index.items():
+            targets = [(proto, hport)]
+            # wiersz UDP bez własnego mapowania dostaje mapowanie TCP z tego samego portu
+            if proto == "TCP" and ("UDP", hport) not in index:
+                targets.append(("UDP", hport))
+            primary = infos[0]
+            name = primary.container_name
+            if len(infos) > 1:
+                name += f" (+{len(infos)-1})"
+            for key in targets:
+                i = row_pos.get(key)
+                if i is None:
+                    continue
+                # Kopia zamiast mutacji — rekordy FREE z cache muszą zostać czyste
+                rows[i] = replace(
+                    rows[i], docker_name=name, docker_id=primary.container_id,
+                    docker_image=primary.image, docker_cport=primary.container_port,
+                )
+                by_id.setdefault(primary.container_id, rows[i])
+        self._by_docker_id = by_id
 
     def _build_range_view(self) -> List[PortRecord]:
         start = min(self.range_from.value(), self.range_to.value())
@@ -625,27 +1180,61 @@ class MainWindow(QMainWindow):
             key = (r.protocol.upper(), int(r.port))
             if key not in used_ports_map:
                 used_ports_map[key] = r
+        only_used = self.cb_only_used.isChecked()
+        only_docker = self.cb_only_docker.isChecked()
+
+        # Przy filtrach nie chodzimy po całym zakresie — tylko po kluczach, które mogą przejść
+        keys: Iterable[Tuple[str, int]]
+        if only_docker:
+            wanted = set()
+            for proto, hport in self._docker_index:
+                # jak w pełnym zakresie: tylko TCP/UDP (bez np. SCTP)
+                if proto in ("TCP", "UDP") and start <= hport <= end:
+                    wanted.add((proto, hport))
+                    if proto == "TCP":
+                        wanted.add(("UDP", hport))
+            keys = sorted(wanted, key=_range_order)
+        elif only_used:
+            keys = sorted(
+                (k for k in used_ports_map if k[0] in ("TCP", "UDP") and start <= k[1] <= end),
+                key=_range_order,
+            )
+        else:
+            keys = ((p, port) for p in ("TCP", "UDP") for port in range(start, end + 1))
+
         rows: List[PortRecord] = []
-        for p in ("TCP", "UDP"):
-            for port in range(start, end + 1):
-                r = used_ports_map.get((p, port))
-                if r is not None:
-                    rows.append(r)
-                else:
-                    if not self.cb_only_used.isChecked():
-                        rows.append(PortRecord(
-                            port=port, protocol=p, status="FREE", pid=None, process="",
-                            local_addr=f"*:{port}", remote_addr="",
-                        ))
-        rows = self._enrich_with_docker(rows)
-        if self.cb_only_docker.isChecked():
+        row_pos: Dict[Tuple[str, int], int] = {}
+        free_rows = self._free_rows
+        for key in keys:
+            r = used_ports_map.get(key)
+            if r is None and not only_used:
+                r = free_rows.get(key)
+                if r is None:
+                    p, port = key
+                    r = free_rows[key] = PortRecord(
+                        port=port, protocol=p, status="FREE", pid=None, process="",
+                        laddr=("*", port), raddr="",
+                    )
+            if r is not None:
+                row_pos[key] = len(rows)
+                rows.append(r)
+        self._stamp_docker(rows, row_pos)
+        if only_docker:
             rows = [r for r in rows if r.docker_name]
         return rows
 
     def update_view(self):
+        sig = (
+            self.range_from.value(), self.range_to.value(),
+            self.cb_only_used.isChecked(), self.cb_only_docker.isChecked(),
+            self._net_sig, self._docker_sig,
+        )
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
         rows = self._build_range_view()
         self.model.setRows(rows)
-        self.statusBar().showMessage(f"Wyświetlanych: {len(rows)}")
+        self._scan_status(f"Wyświetlanych: {len(rows)}")
 
     def scan_range(self):
         self.update_view()
@@ -664,188 +1253,426 @@ class MainWindow(QMainWindow):
         src_idx = self.proxy.mapToSource(sel[0])
         return self.model.row(src_idx.row())
 
+    def _action_record(self) -> Optional[PortRecord]:
+        # W trakcie menu kontekstowego akcje dotyczą klikniętego wiersza, poza nim — zaznaczenia
+        if self._ctx_current_rec is not None:
+            return self._ctx_current_rec
+        return self._current_record()
+
+    def _selected_records(self) -> List[PortRecord]:
+        return [self.model.row(self.proxy.mapToSource(i).row())
+                for i in self.table.selectionModel().selectedRows()]
+
     def _clear_details(self):
         for w in (self.lbl_port, self.lbl_proto, self.lbl_status, self.lbl_pid, self.lbl_proc,
                   self.lbl_local, self.lbl_remote, self.lbl_docker, self.lbl_image):
-            w.setText("—")
+            _set_text(w, "—")
         self.btn_open.setEnabled(False)
         self.btn_kill.setEnabled(False)
         self.btn_stop.setEnabled(False)
         self.btn_restart.setEnabled(False)
 
     def _populate_details(self, rec: PortRecord):
-        self.lbl_port.setText(str(rec.port))
-        self.lbl_proto.setText(rec.protocol)
-        st = rec.status or ("FREE" if rec.is_free else "")
-        self.lbl_status.setText(st)
-        self.lbl_pid.setText(str(rec.pid) if rec.pid else "—")
-        self.lbl_proc.setText(rec.process or "—")
-        self.lbl_local.setText(rec.local_addr or "—")
-        self.lbl_remote.setText(rec.remote_addr or "—")
-        self.lbl_docker.setText(rec.docker_name or "—")
-        self.lbl_image.setText(rec.docker_image or "—")
-
-        self.btn_open.setText(f"Otwórz http://localhost:{rec.port}")
+        _set_text(self.lbl_port, rec.port)
+        _set_text(self.lbl_proto, rec.protocol)
+        _set_text(self.lbl_status, rec.status)
+        _set_text(self.lbl_pid, rec.pid or "—")
+        _set_text(self.lbl_proc, rec.process or "—")
+        _set_text(self.lbl_local, rec.local_addr or "—")
+        _set_text(self.lbl_remote, rec.remote_addr or "—")
+        _set_text(self.lbl_docker, rec.docker_name or "—")
+        _set_text(self.lbl_image, rec.docker_image or "—")
+
+        if rec.port != self._btn_open_port:
+            self._btn_open_port = rec.port
+            self.btn_open.setText(f"Otwórz http://localhost:{rec.port}")
         self.btn_open.setEnabled(True)
         self.btn_kill.setEnabled(bool(rec.pid))
         self.btn_stop.setEnabled(bool(rec.docker_id))
         self.btn_restart.setEnabled(bool(rec.docker_id))
 
     def _detail_open(self):
-        rec = self._current_record()
+        rec = self._action_record()
         if not rec:
             return
-        url = "https://localhost" if rec.port == 443 else f"http://localhost:{rec.port}"
-        webbrowser.open(url)
+        QDesktopServices.openUrl(QUrl(rec.url))
 
     def _detail_kill(self):
-        rec = self._current_record()
-        if not rec or not rec.pid:
+        # Przy zaznaczeniu wielu wierszy kończymy wszystkie różne PID-y jednym wywołaniem
+        recs: Dict[int, PortRecord] = {}
+        selected = [self._ctx_current_rec] if self._ctx_current_rec is not None else self._selected_records()
+        for r in selected:
+            if r.pid:
+                recs.setdefault(r.pid, r)
+        if not recs:
             return
         extra_warn = ""
-        if rec.docker_id or ("docker" in (rec.process or "").lower()) or ("com.docker" in (rec.process or "").lower()):
-            extra_warn = "\n\nUWAGA: Ten port wygląda na używany przez Docker. Zabicie procesu może ubić całe środowisko Dockera."
-        confirm = QMessageBox.question(
-            self, "Potwierdź",
-            f"Na pewno zakończyć proces PID {rec.pid} ({rec.process})?{extra_warn}",
-            QMessageBox.Yes | QMessageBox.No
-        )
+        for rec in recs.values():
+            if rec.docker_id or ("docker" in (rec.process or "").lower()) or ("com.docker" in (rec.process or "").lower()):
+                extra_warn = "\n\nUWAGA: Ten port wygląda na używany przez Docker. Zabicie procesu może ubić całe środowisko Dockera."
+                break
+        pids = list(recs)
+        if len(pids) == 1:
+            rec = recs[pids[0]]
+            question = f"Na pewno zakończyć proces PID {rec.pid} ({rec.process})?{extra_warn}"
+        else:
+            listed = ", ".join(f"{r.pid} ({r.process})" for r in recs.values())
+            question = f"Na pewno zakończyć {len(pids)} procesów: {listed}?{extra_warn}"
+        confirm = QMessageBox.question(self, "Potwierdź", question, QMessageBox.Yes | QMessageBox.No)
         if confirm != QMessageBox.Yes:
             return
-        ok, err = kill_process(rec.pid)
+        self.btn_kill.setEnabled(False)
+        if len(pids) == 1:
+            self._run_action(lambda: kill_process(pids[0]), lambda ok, err: self._on_kill_done(pids, ok, err))
+        else:
+            self._run_action(lambda: kill_processes(pids), lambda ok, err: self._on_kill_done(pids, ok, err))
+
+    def _on_kill_done(self, pids: List[int], ok: bool, err: str):
+        self._refresh_detail_buttons()
         if ok:
-            QMessageBox.information(self, "Sukces", f"Proces {rec.pid} zakończony.")
-            self.refresh_now()
+            if len(pids) == 1:
+                QMessageBox.information(self, "Sukces", f"Proces {pids[0]} zakończony.")
+            else:
+                QMessageBox.information(self, "Sukces", f"Procesy {', '.join(map(str, pids))} zakończone.")
+        elif len(pids) == 1:
+            QMessageBox.critical(self, "Błąd", f"Nie udało się zakończyć PID {pids[0]}: {err}")
         else:
-            QMessageBox.critical(self, "Błąd", f"Nie udało się zakończyć PID {rec.pid}: {err}")
+            QMessageBox.critical(self, "Błąd", f"Nie wszystkie procesy zakończono:\n{err}")
+        self.refresh_now()
 
     def _detail_stop(self):
-        rec = self._current_record()
+        rec = self._action_record()
         if rec:
             self.docker_stop(rec)
 
     def _detail_restart(self):
-        rec = self._current_record()
+        rec = self._action_record()
         if rec:
             self.docker_restart(rec)
 
+    def _on_model_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, *_):
+        sel = self.table.selectionModel().selectedRows()
+        if sel and top_left.row() <= self.proxy.mapToSource(sel[0]).row() <= bottom_right.row():
+            self._refresh_detail_buttons()
+
+    def _refresh_detail_buttons(self):
+        rec = self._current_record()
+        if rec:
+            self._populate_details(rec)
+        else:
+            self._clear_details()
+
+    # ---------- Akcje w tle ----------
+    def _run_action(self, fn: Callable[[], Tuple[bool, str]], on_done: Callable[[bool, str], None]):
+        self._action_seq += 1
+        job = _ActionRunnable(fn, self.action_done, self._action_seq)
+        self._actions[self._action_seq] = (job, on_done)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_action_done(self, job_id: int, result):
+        entry = self._actions.pop(job_id, None)
+        if entry is not None:
+            ok, msg = result
+            entry[1](ok, msg)
+
     # ---------- Menu kontekstowe ----------
+    def _build_ctx_menu(self):
+        # Menu i akcje tworzone raz; przy każdym otwarciu zmieniamy tylko teksty/widoczność
+        self._ctx_current_rec: Optional[PortRecord] = None
+        self._ctx_last_key: Optional[Tuple[str, int]] = None
+        self._ctx_menu = QMenu(self)
+        self._act_kill = self._ctx_menu.addAction("Zakończ proces blokujący ten port")
+        self._act_kill.triggered.connect(self._detail_kill)
+        self._act_docker_sep = self._ctx_menu.addSeparator()
+        self._act_stop = self._ctx_menu.addAction("")
+        self._act_stop.triggered.connect(self._detail_stop)
+        self._act_restart = self._ctx_menu.addAction("")
+        self._act_restart.triggered.connect(self._detail_restart)
+        self._act_open = self._ctx_menu.addAction("")
+        self._act_open.triggered.connect(self._detail_open)
+        self._act_details = self._ctx_menu.addAction("Szczegóły (panel po prawej)")
+        self._act_details.triggered.connect(self._ctx_details)
+
     def _on_table_ctx(self, pos):
         idx = self.table.indexAt(pos)
         if not idx.isValid():
             return
         src_idx = self.proxy.mapToSource(idx)
         rec = self.model.row(src_idx.row())
+        self._ctx_current_rec = rec
 
-        menu = QMenu(self)
-        act_kill = QAction("Zakończ proces blokujący ten port", self)
-        act_kill.triggered.connect(lambda: self._detail_kill())
-        menu.addAction(act_kill)
-
-        if rec.docker_id:
-            menu.addSeparator()
-            act_stop = QAction(f"Zatrzymaj kontener [{rec.docker_name}]", self)
-            act_stop.triggered.connect(lambda: self._detail_stop())
-            menu.addAction(act_stop)
+        has_docker = bool(rec.docker_id)
+        for act in (self._act_docker_sep, self._act_stop, self._act_restart, self._act_open):
+            act.setVisible(has_docker)
+        # Ten sam kontener i port co ostatnio — teksty akcji są już aktualne
+        if has_docker and self._ctx_last_key != (rec.docker_name, rec.port):
+            self._ctx_last_key = (rec.docker_name, rec.port)
+            self._act_stop.setText(f"Zatrzymaj kontener [{rec.docker_name}]")
+            self._act_restart.setText(f"Restartuj kontener [{rec.docker_name}]")
+            self._act_open.setText(f"Otwórz http://localhost:{rec.port}")
 
-            act_restart = QAction(f"Restartuj kontener [{rec.docker_name}]", self)
-            act_restart.triggered.connect(lambda: self._detail_restart())
-            menu.addAction(act_restart)
+        self._ctx_menu.exec(self.table.viewport().mapToGlobal(pos))
+        self._ctx_current_rec = None
 
-            act_open = QAction(f"Otwórz http://localhost:{rec.port}", self)
-            act_open.triggered.connect(lambda: self._detail_open())
-            menu.addAction(act_open)
-
-        act_details = QAction("Szczegóły (panel po prawej)", self)
-        act_details.triggered.connect(lambda: self._populate_details(rec))
-        menu.addAction(act_details)
-
-        menu.exec(self.table.viewport().mapToGlobal(pos))
+    def _ctx_details(self):
+        if self._ctx_current_rec is not None:
+            self._populate_details(self._ctx_current_rec)
 
     # ---------- Docker akcje ----------
     def docker_stop(self, rec: PortRecord):
+        self._docker_op(rec, "stop")
+
+    def docker_restart(self, rec: PortRecord):
+        self._docker_op(rec, "restart")
+
+    def _docker_op(self, rec: PortRecord, op: str):
+        # stop potrafi trwać do 10 s (SIGTERM grace) — poza wątkiem GUI
         if not rec.docker_id:
             return
-        if HAS_DOCKER_SDK:
-            try:
-                client = docker.from_env()
-                c = client.containers.get(rec.docker_id)
-                c.stop()
-                QMessageBox.information(self, "Docker", f"Kontener {rec.docker_name} zatrzymany.")
-                self.refresh_docker(); self.refresh_now()
-                return
-            except Exception:
-                pass
+        if rec.docker_id not in self._by_docker_id:
+            # od pobrania rekordu widok przeliczono bez tego kontenera
+            QMessageBox.warning(self, "Docker", f"Kontener {rec.docker_name} nie ma już mapowań portów.")
+            self._refresh_timer.start()
+            return
+        cid, name = rec.docker_id, rec.docker_name
+        self.btn_stop.setEnabled(False); self.btn_restart.setEnabled(False)
+        if not self._sdk_ok:
+            self._docker_op_cli(cid, name, op)
+            return
+        self._run_action(
+            lambda: self._docker_op_blocking(cid, op),
+            lambda ok, how: self._on_docker_op_done(name, op, ok, how),
+        )
+
+    def _docker_op_cli(self, cid: str, name: str, op: str):
+        # Bez SDK: proces CLI w tle, wynik sprawdzamy timerem zamiast czekać
         try:
-            subprocess.check_call(["docker", "stop", rec.docker_id], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-            QMessageBox.information(self, "Docker", f"Kontener {rec.docker_name} zatrzymany (CLI).")
-            self.refresh_docker(); self.refresh_now()
+            proc = subprocess.Popen(["docker", op, cid], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
-            QMessageBox.critical(self, "Docker", f"Błąd zatrzymania kontenera: {e}")
-
-    def docker_restart(self, rec: PortRecord):
-        if not rec.docker_id:
+            self._on_docker_op_done(name, op, False, str(e))
             return
-        if HAS_DOCKER_SDK:
+        QTimer.singleShot(200, lambda: self._finish_docker_cli(proc, name, op))
+
+    def _finish_docker_cli(self, proc: subprocess.Popen, name: str, op: str):
+        rc = proc.poll()
+        if rc is None:
+            QTimer.singleShot(200, lambda: self._finish_docker_cli(proc, name, op))
+        elif rc == 0:
+            self._on_docker_op_done(name, op, True, "CLI")
+        else:
+            self._on_docker_op_done(name, op, False, str(subprocess.CalledProcessError(rc, proc.args)))
+
+    def _docker(self):
+        # Współdzielony klient SDK dla akcji, tworzony przy pierwszym użyciu
+        if self._docker_client is None:
+            self._docker_client = docker.from_env()
+        return self._docker_client
+
+    @staticmethod
+    def _probe_sdk() -> Tuple[bool, str]:
+        client = docker.from_env(timeout=0.5)
+        try:
+            return bool(client.ping()), ""
+        finally:
+            client.close()
+
+    def _on_sdk_probed(self, ok: bool, _err: str):
+        self._sdk_ok = ok or self._docker_events_live
+
+    def _docker_op_blocking(self, cid: str, op: str) -> Tuple[Optional[bool], str]:
+        # Wątek puli — wolno tu ruszać tylko klienta, nie widżety; ok=None: kontener nie istnieje
+        if self._sdk_ok:
             try:
-                client = docker.from_env()
-                c = client.containers.get(rec.docker_id)
-                c.restart()
-                QMessageBox.information(self, "Docker", f"Kontener {rec.docker_name} zrestartowany.")
-                self.refresh_docker(); self.refresh_now()
-                return
+                getattr(self._docker().containers.get(cid), op)(timeout=10)
+                return True, "SDK"
+            except docker.errors.NotFound:
+                # demon odpowiedział — CLI dałoby ten sam wynik
+                return None, ""
+            except docker.errors.APIError as e:
+                return False, getattr(e, "explanation", None) or str(e)
             except Exception:
-                pass
-        try:
-            subprocess.check_call(["docker", "restart", rec.docker_id], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-            QMessageBox.information(self, "Docker", f"Kontener {rec.docker_name} zrestartowany (CLI).")
-            self.refresh_docker(); self.refresh_now()
-        except Exception as e:
-            QMessageBox.critical(self, "Docker", f"Błąd restartu kontenera: {e}")
+                # błąd połączenia (DockerException, requests) — ratujemy się CLI
+                self._docker_client = None  # następna akcja połączy się od nowa
+                self._sdk_ok = False  # demon nieosiągalny — kolejne akcje od razu przez CLI
+        return docker_container_cli(cid, op)
+
+    def _on_docker_op_done(self, name: str, op: str, ok: Optional[bool], how: str):
+        self._refresh_detail_buttons()
+        done, noun = _DOCKER_OP_TEXT[op]
+        if ok:
+            via = " (CLI)" if how == "CLI" else ""
+            self._notify(f"Kontener {name} {done}{via}.")
+            self._refresh_timer.start()
+        elif ok is None:
+            QMessageBox.warning(self, "Docker", f"Kontener {name} już nie istnieje.")
+            self._refresh_timer.start()  # widok pokazuje nieaktualne mapowanie
+        else:
+            QMessageBox.critical(self, "Docker", f"Błąd {noun} kontenera: {how}")
 
     # ---------- Motywy ----------
     def apply_theme(self, dark: bool):
-        self.active_dark = bool(dark)
-        self.setStyleSheet(DARK_QSS if dark else LIGHT_QSS)
+        dark = bool(dark)
+        if self._applied_dark == dark:
+            return  # ponowne parsowanie QSS i polerowanie widżetów bez zmiany wyglądu
+        self._applied_dark = self.active_dark = dark
+        # Na poziomie aplikacji — dziedziczą go też okna dialogowe i menu
+        QApplication.instance().setStyleSheet(DARK_QSS if dark else LIGHT_QSS)
         self.settings.setValue("theme_dark", self.active_dark)
 
     def toggle_theme(self):
         self.apply_theme(not self.active_dark)
 
+    def _update_timer_state(self):
+        # Okno ukryte/zminimalizowane albo aplikacja w tle — planista stoi; po powrocie od razu nadrabia
+        paused = (not self.isVisible() or self.isMinimized()
+                  or QGuiApplication.applicationState() != Qt.ApplicationActive)
+        if paused:
+            self.timer.stop()
+        elif not self.timer.isActive():
+            self.timer.start()
+            self._tick()
+
+    def changeEvent(self, e):
+        if e.type() == QEvent.WindowStateChange:
+            self._update_timer_state()
+        super().changeEvent(e)
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._update_timer_state()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._update_timer_state()
+
+    def closeEvent(self, e):
+        self.timer.stop()
+        if self._docker_events is not None:
+            self._docker_events.stop()
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+        super().closeEvent(e)
+
+# ------------------ Docker: akcje na kontenerach ------------------
+# op -> (imiesłów do komunikatu, rzeczownik do błędu)
+_DOCKER_OP_TEXT = {"stop": ("zatrzymany", "zatrzymania"), "restart": ("zrestartowany", "restartu")}
+
+
+def docker_container_cli(container_id: str, op: str) -> Tuple[bool, str]:
+    # docker stop|restart przez CLI (blokujące); (True, "CLI") albo (False, błąd)
+    try:
+        subprocess.run(["docker", op, container_id], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, check=True)
+        return True, "CLI"
+    except Exception as e:
+        return False, str(e)
+
 # ------------------ Zabijanie procesu ------------------
 
-def kill_process(pid: int):
+def _kill_error(e: Exception) -> str:
+    if isinstance(e, subprocess.CalledProcessError):
+        return f"taskkill error: {e}"
+    if isinstance(e, PermissionError):
+        return "Brak uprawnień (uruchom jako administrator)."
+    if isinstance(e, ProcessLookupError):
+        return "Proces nie istnieje."
+    return str(e)
+
+
+def _kill_psutil(pid: int, timeout: float):
+    p = psutil.Process(pid)
+    p.terminate()
+    _, alive = psutil.wait_procs([p], timeout=timeout)
+    for a in alive:
+        a.kill()
+
+
+def _kill_taskkill(pid: int, timeout: float):
+    subprocess.check_call(["taskkill", "/PID", str(pid), "/T", "/F"], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+
+
+_KERNEL32 = None
+if os.name == 'nt':
+    from ctypes import wintypes
+    _KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    # Jawne prototypy — HANDLE to wskaźnik, domyślny c_int uciąłby go na 64 bitach
+    _KERNEL32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _KERNEL32.OpenProcess.restype = wintypes.HANDLE
+    _KERNEL32.TerminateProcess.argtypes = (wintypes.HANDLE, wintypes.UINT)
+    _KERNEL32.TerminateProcess.restype = wintypes.BOOL
+    _KERNEL32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _KERNEL32.CloseHandle.restype = wintypes.BOOL
+_PROCESS_TERMINATE = 0x0001
+_ERROR_ACCESS_DENIED = 5
+_ERROR_INVALID_PARAMETER = 87  # OpenProcess na nieistniejącym PID
+
+
+def _kill_win32(pid: int, timeout: float):
+    # TerminateProcess bez uruchamiania procesu; taskkill tylko przy braku dostępu
+    h = _KERNEL32.OpenProcess(_PROCESS_TERMINATE, False, pid)
+    if not h:
+        err = ctypes.get_last_error()
+        if err == _ERROR_ACCESS_DENIED:
+            return _kill_taskkill(pid, timeout)
+        if err == _ERROR_INVALID_PARAMETER:
+            raise ProcessLookupError(pid)
+        raise ctypes.WinError(err)
     try:
-        if HAS_PSUTIL:
-            p = psutil.Process(pid)
-            p.terminate()
+        if not _KERNEL32.TerminateProcess(h, 1):
+            err = ctypes.get_last_error()
+            if err == _ERROR_ACCESS_DENIED:
+                return _kill_taskkill(pid, timeout)
+            raise ctypes.WinError(err)
+    finally:
+        _KERNEL32.CloseHandle(h)
+
+
+def _kill_posix(pid: int, timeout: float):
+    os.kill(pid, signal.SIGTERM)
+
+
+# Wariant wybrany raz przy imporcie
+_KILL_IMPL = _kill_psutil if HAS_PSUTIL else (_kill_win32 if os.name == 'nt' else _kill_posix)
+
+
+def kill_process(pid: int, timeout: float = 1.0):
+    try:
+        _KILL_IMPL(pid, timeout)
+        return True, ""
+    except Exception as e:
+        return False, _kill_error(e)
+
+
+def kill_processes(pids: List[int], timeout: float = 1.0) -> Tuple[bool, str]:
+    # Jedna runda terminate + wspólne wait_procs; bez psutil każdy PID przez _KILL_IMPL. Błędy: „PID n: opis”
+    errors: List[str] = []
+    if HAS_PSUTIL:
+        procs = []
+        for pid in pids:
+            try:
+                p = psutil.Process(pid)
+                p.terminate()
+                procs.append(p)
+            except Exception as e:
+                errors.append(f"PID {pid}: {_kill_error(e)}")
+        _, alive = psutil.wait_procs(procs, timeout=timeout)
+        for p in alive:
             try:
-                p.wait(timeout=3)
-            except Exception:
                 p.kill()
-            return True, ""
-        if os.name == 'nt':
-            subprocess.check_call(["taskkill", "/PID", str(pid), "/T", "/F"], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-            return True, ""
-        else:
-            os.kill(pid, 15)
-            return True, ""
-    except subprocess.CalledProcessError as e:
-        return False, f"taskkill error: {e}"
-    except PermissionError:
-        return False, "Brak uprawnień (uruchom jako administrator)."
-    except ProcessLookupError:
-        return False, "Proces nie istnieje."
-    except Exception as e:
-        return False, str(e)
+            except Exception as e:
+                errors.append(f"PID {p.pid}: {_kill_error(e)}")
+    else:
+        for pid in pids:
+            try:
+                _KILL_IMPL(pid, timeout)
+            except Exception as e:
+                errors.append(f"PID {pid}: {_kill_error(e)}")
+    return not errors, "\n".join(errors)
 
 # ------------------ Uruchomienie ------------------
 
 def main():
-    # MUSI być przed QApplication
-    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
+    # MUSI być przed QApplication; PassThrough dla skalowania DPI to w Qt6 domyślna polityka
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
     app = QApplication(sys.argv)
     w = MainWindow(); w.show()
     sys.exit(app.exec())